@@ -129,10 +129,11 @@ class FormatChecker:
                 if the instance does not conform to ``format``
 
         """
-        if format not in self.checkers:
+        checker = self.checkers.get(format)
+        if checker is None:
             return
 
-        func, raises = self.checkers[format]
+        func, raises = checker
         result, cause = None, None
         try:
             result = func(instance)
@@ -18,8 +18,9 @@ def patternProperties(validator, patternProperties, instance, schema):
         return
 
     for pattern, subschema in patternProperties.items():
+        regex = re.compile(pattern)
         for k, v in instance.items():
-            if re.search(pattern, k):
+            if regex.search(k):
                 yield from validator.descend(
                     v, subschema, path=k, schema_path=pattern,
                 )
@@ -267,7 +268,13 @@ def dependentSchemas(validator, dependentSchemas, instance, schema):
 
 
 def enum(validator, enums, instance, schema):
-    if all(not equal(each, instance) for each in enums):
+    if isinstance(instance, str) and isinstance(enums, list):
+        # Strings only ever equal other strings, so list membership already
+        # has the semantics of `equal`, without a Python-level call per item.
+        found = instance in enums
+    else:
+        found = any(equal(each, instance) for each in enums)
+    if not found:
         yield ValidationError(f"{instance!r} is not one of {enums!r}")
 
 
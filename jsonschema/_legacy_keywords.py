@@ -378,9 +378,10 @@ def find_evaluated_property_keys_by_schema(validator, instance, schema):
                         evaluated_keys.append(property)
 
     if "patternProperties" in schema:
+        regexes = [re.compile(each) for each in schema["patternProperties"]]
         for property in instance:
-            for pattern in schema["patternProperties"]:
-                if re.search(pattern, property):
+            for regex in regexes:
+                if regex.search(property):
                     evaluated_keys.append(property)
 
     if "dependentSchemas" in schema:
@@ -77,9 +77,10 @@ def find_additional_properties(instance, schema):
     """
     properties = schema.get("properties", {})
     patterns = "|".join(schema.get("patternProperties", {}))
+    regex = re.compile(patterns) if patterns else None
     for property in instance:
         if property not in properties:
-            if patterns and re.search(patterns, property):
+            if regex is not None and regex.search(property):
                 continue
             yield property
 
@@ -312,9 +313,10 @@ def find_evaluated_property_keys_by_schema(validator, instance, schema):
                         evaluated_keys.append(property)
 
     if "patternProperties" in schema:
+        regexes = [re.compile(each) for each in schema["patternProperties"]]
         for property in instance:
-            for pattern in schema["patternProperties"]:
-                if re.search(pattern, property):
+            for regex in regexes:
+                if regex.search(property):
                     evaluated_keys.append(property)
 
     if "dependentSchemas" in schema:
@@ -4,7 +4,7 @@ Python representations of the JSON Schema Test Suite tests.
 from __future__ import annotations
 
 from contextlib import suppress
-from functools import partial
+from functools import cache, partial
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
 import json
@@ -13,7 +13,7 @@ import re
 import sys
 import unittest
 
-from attrs import field, frozen
+from attrs import evolve, field, frozen
 from referencing import Registry
 import referencing.jsonschema
 
@@ -23,6 +23,8 @@ if TYPE_CHECKING:
     from referencing.jsonschema import Schema
     import pyperf
 
+    from jsonschema.protocols import Validator
+
 from jsonschema.validators import _VALIDATORS
 import jsonschema
 
@@ -90,6 +92,15 @@ class Version:
         for case in self.cases():
             case.benchmark(**kwargs)
 
+    def crawled(self) -> Version:
+        """
+        This version, with its registry of remotes crawled up front.
+
+        Benchmarks should use the uncrawled registry, since crawling lazily
+        is part of the cost real callers pay.
+        """
+        return evolve(self, remotes=self._remotes.crawl())
+
     def cases(self) -> Iterable[_Case]:
         return self._cases_in(paths=self._path.glob("*.json"))
 
@@ -122,7 +133,7 @@ class Version:
 
     def _cases_in(self, paths: Iterable[Path]) -> Iterable[_Case]:
         for path in paths:
-            for case in json.loads(path.read_text(encoding="utf-8")):
+            for case in json.loads(path.read_bytes()):
                 yield _Case.from_dict(
                     case,
                     version=self,
@@ -146,6 +157,7 @@ class _Case:
     @classmethod
     def from_dict(cls, data, remotes, **kwargs):
         data.update(kwargs)
+        checked = set()
         tests = [
             _Test(
                 version=data["version"],
@@ -153,6 +165,7 @@ class _Case:
                 case_description=data["description"],
                 schema=data["schema"],
                 remotes=remotes,
+                checked=checked,
                 **test,
             ) for test in data.pop("tests")
         ]
@@ -176,9 +189,7 @@ def remotes_in(
     # have no $schema and which are invalid under earlier versions, in with
     # other schemas which are needed for tests.
 
-    for each in root.rglob("*.json"):
-        schema = json.loads(each.read_text())
-
+    for each, schema in _parsed_remotes(root):
         relative = str(each.relative_to(root)).replace("\\", "/")
 
         if (
@@ -196,6 +207,18 @@ def remotes_in(
         yield f"{MAGIC_REMOTE_URL}/{relative}", schema
 
 
+@cache
+def _parsed_remotes(root: Path) -> Sequence[tuple[Path, Schema]]:
+    """
+    Each remote in the suite alongside its parsed contents.
+
+    Parsed once and shared by every version, rather than re-read per draft.
+    """
+    return [
+        (each, json.loads(each.read_bytes())) for each in root.rglob("*.json")
+    ]
+
+
 @frozen(repr=False)
 class _Test:
 
@@ -214,6 +237,9 @@ class _Test:
 
     comment: str | None = None
 
+    # Validator classes which have already checked this (shared) schema.
+    _checked: set[type[Validator]] = field(factory=set, eq=False)
+
     def __repr__(self):  # pragma: no cover
         return f"<Test {self.fully_qualified_name}>"
 
@@ -231,11 +257,11 @@ class _Test:
     def to_unittest_method(self, skip=lambda test: None, **kwargs):
         if self.valid:
             def fn(this):
-                self.validate(**kwargs)
+                self._validate_checking_schema_once(**kwargs)
         else:
             def fn(this):
                 with this.assertRaises(jsonschema.ValidationError):
-                    self.validate(**kwargs)
+                    self._validate_checking_schema_once(**kwargs)
 
         fn.__name__ = "_".join(
             [
@@ -253,8 +279,9 @@ class _Test:
         else:
             return unittest.skip(reason)(fn)
 
-    def validate(self, Validator, **kwargs):
-        Validator.check_schema(self.schema)
+    def validate(self, Validator, check_schema=True, **kwargs):
+        if check_schema:
+            Validator.check_schema(self.schema)
         validator = Validator(
             schema=self.schema,
             registry=self._remotes,
@@ -264,6 +291,18 @@ class _Test:
             breakpoint()  # noqa: T100
         validator.validate(instance=self.data)
 
+    def _validate_checking_schema_once(self, Validator, **kwargs):
+        """
+        Validate, skipping the schema check if another test in the case did it.
+
+        Only used by the unittest methods -- benchmarks should keep timing
+        the schema check each time via `validate`.
+        """
+        if Validator not in self._checked:
+            Validator.check_schema(self.schema)
+            self._checked.add(Validator)
+        self.validate(Validator=Validator, check_schema=False, **kwargs)
+
     def validate_ignoring_errors(self, Validator):  # pragma: no cover
         with suppress(jsonschema.ValidationError):
             self.validate(Validator=Validator)
@@ -6,17 +6,19 @@ Tests comprehensive correctness of each draft's validator.
 See https://github.com/json-schema-org/JSON-Schema-Test-Suite for details.
 """
 
+from functools import cache
 
 from jsonschema.tests._suite import Suite
 import jsonschema
 
 SUITE = Suite()
-DRAFT3 = SUITE.version(name="draft3")
-DRAFT4 = SUITE.version(name="draft4")
-DRAFT6 = SUITE.version(name="draft6")
-DRAFT7 = SUITE.version(name="draft7")
-DRAFT201909 = SUITE.version(name="draft2019-09")
-DRAFT202012 = SUITE.version(name="draft2020-12")
+# Crawl each registry once here rather than in every test's resolver.
+DRAFT3 = SUITE.version(name="draft3").crawled()
+DRAFT4 = SUITE.version(name="draft4").crawled()
+DRAFT6 = SUITE.version(name="draft6").crawled()
+DRAFT7 = SUITE.version(name="draft7").crawled()
+DRAFT201909 = SUITE.version(name="draft2019-09").crawled()
+DRAFT202012 = SUITE.version(name="draft2020-12").crawled()
 
 
 def skip(message, **kwargs):
@@ -31,14 +33,17 @@ def ecmascript_regex(test):
         return "ECMA regex support will be added in #1142."
 
 
+@cache
 def missing_format(Validator):
+    checkers = Validator.FORMAT_CHECKER.checkers
+
     def missing_format(test):  # pragma: no cover
         schema = test.schema
         if (
             schema is True
             or schema is False
             or "format" not in schema
-            or schema["format"] in Validator.FORMAT_CHECKER.checkers
+            or schema["format"] in checkers
             or test.valid
         ):
             return
@@ -260,3 +265,4 @@ TestDraft202012Format = DRAFT202012.to_unittest_testcase(
         or complex_email_validation(test)
     ),
 )
+
@@ -0,0 +1,55 @@
+from pathlib import Path
+from unittest import TestCase, mock
+
+from referencing import Registry
+
+from jsonschema import Draft7Validator, Draft202012Validator, SchemaError
+from jsonschema.tests._suite import Version, _Case
+
+
+def case_with(schema, *tests):
+    return _Case.from_dict(
+        {
+            "description": "a case",
+            "schema": schema,
+            "tests": [
+                {"description": str(i), "data": data, "valid": valid}
+                for i, (data, valid) in enumerate(tests)
+            ],
+        },
+        version=Version(path=Path(), remotes=Registry(), name="test"),
+        subject="test",
+        remotes=Registry(),
+    )
+
+
+class TestUnittestMethods(TestCase):
+    def test_schema_is_checked_once_per_case_and_validator(self):
+        schema = {"type": "integer"}
+        case = case_with(schema, (12, True), ("foo", False), (13, True))
+
+        checked = []
+        for Validator in Draft7Validator, Draft202012Validator:
+            with mock.patch.object(Validator, "check_schema", checked.append):
+                for test in case.tests:
+                    test.to_unittest_method(Validator=Validator)(self)
+        self.assertEqual(checked, [schema, schema])
+
+    def test_invalid_schema_fails_every_test_in_its_case(self):
+        case = case_with({"type": 12}, (12, True), (12, False), (13, True))
+        for test in case.tests:
+            method = test.to_unittest_method(Validator=Draft202012Validator)
+            with self.assertRaises(SchemaError):
+                method(self)
+
+    def test_validate_checks_the_schema_every_time(self):
+        schema = {"type": "integer"}
+        case = case_with(schema, (12, True), (13, True))
+
+        checked = []
+        Validator = Draft202012Validator
+        with mock.patch.object(Validator, "check_schema", checked.append):
+            for test in case.tests:
+                test.validate(Validator=Validator)
+                test.validate(Validator=Validator)
+        self.assertEqual(checked, [schema] * 4)
@@ -418,9 +418,7 @@ class TestValidationErrorMessages(TestCase):
             schema=schema,
         )
 
-        self.assertIn(repr("foo"), message)
-        self.assertIn(repr("bar"), message)
-        self.assertIn("were unexpected)", message)
+        self.assertIn("('bar', 'foo' were unexpected)", message)
 
     def test_const(self):
         schema = {"const": 12}
@@ -1670,6 +1668,13 @@ class ValidatorTestMixin(MetaSchemaTestsMixin):
     def test_non_existent_properties_are_ignored(self):
         self.Validator({object(): object()}).validate(instance=object())
 
+    def test_enum_with_a_tuple_is_not_a_substring_check(self):
+        validator = self.Validator({"enum": ("foo", "bar")})
+        self.assertEqual(
+            (validator.is_valid("foo"), validator.is_valid("fo")),
+            (True, False),
+        )
+
     def test_evolve(self):
         schema, format_checker = {"type": "integer"}, FormatChecker()
         original = self.Validator(
@@ -1736,7 +1741,7 @@ class ValidatorTestMixin(MetaSchemaTestsMixin):
         )
 
         validator = Validator(schema)
-        validator.validate([1, 1.1, Decimal(1) / Decimal(8)])
+        validator.validate([1, 1.1, Decimal("0.125")])
 
         invalid = ["foo", {}, [], True, None]
         self.assertEqual(
@@ -2366,7 +2371,6 @@ class TestRefResolver(TestCase):
 
     def test_it_retrieves_unstored_refs_via_urlopen(self):
         ref = "http://bar#baz"
-        schema = {"baz": 12}
 
         if "requests" in sys.modules:  # pragma: no cover
             self.addCleanup(
@@ -2377,7 +2381,7 @@ class TestRefResolver(TestCase):
         @contextmanager
         def fake_urlopen(url):
             self.assertEqual(url, "http://bar")
-            yield BytesIO(json.dumps(schema).encode("utf8"))
+            yield BytesIO(b'{"baz": 12}')
 
         self.addCleanup(setattr, validators, "urlopen", validators.urlopen)
         validators.urlopen = fake_urlopen